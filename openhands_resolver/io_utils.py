@@ -1,15 +1,23 @@
 import json
-from typing import Iterable
+import os
+from typing import Iterable, TextIO
 from openhands_resolver.resolver_output import ResolverOutput
 
 
-def load_all_resolver_outputs(output_jsonl: str) -> Iterable[ResolverOutput]:
-    with open(output_jsonl, "r") as f:
-        for line in f:
-            yield ResolverOutput.model_validate(json.loads(line))
+def load_all_resolver_outputs(
+    output_jsonl: str | os.PathLike | TextIO,
+) -> Iterable[ResolverOutput]:
+    if isinstance(output_jsonl, (str, os.PathLike)):
+        with open(output_jsonl, "r") as f:
+            yield from load_all_resolver_outputs(f)
+        return
+    for line in output_jsonl:
+        yield ResolverOutput.model_validate(json.loads(line))
 
 
-def load_single_resolver_output(output_jsonl: str, issue_number: int) -> ResolverOutput:
+def load_single_resolver_output(
+    output_jsonl: str | os.PathLike | TextIO, issue_number: int
+) -> ResolverOutput:
     for resolver_output in load_all_resolver_outputs(output_jsonl):
         if resolver_output.issue.number == issue_number:
             return resolver_output
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import tempfile
+
+# Just enough environment for git; skips user/system config and inherited vars
+MINIMAL_ENV = {
+    "PATH": os.environ["PATH"],
+    "HOME": tempfile.gettempdir(),
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+    "GIT_CONFIG_SYSTEM": "/dev/null",
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_AUTHOR_DATE": "2024-01-01T00:00:00Z",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+    "GIT_COMMITTER_DATE": "2024-01-01T00:00:00Z",
+}
+
+
+def run_git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "core.fsync=none", *args],
+        cwd=cwd,
+        env=MINIMAL_ENV,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
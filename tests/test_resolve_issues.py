@@ -16,6 +16,7 @@ from openhands.events.observation import CmdOutputObservation, NullObservation
 from openhands_resolver.resolver_output import ResolverOutput
 from openhands.core.config import LLMConfig
 from openhands.memory.history import ShortTermHistory
+from git_helpers import run_git
 
 
 @pytest.fixture
@@ -24,12 +25,12 @@ def mock_output_dir():
         repo_path = os.path.join(temp_dir, "repo")
         # Initialize a GitHub repo in "repo" and add a commit with "README.md"
         os.makedirs(repo_path)
-        os.system(f"git init {repo_path}")
+        run_git("init", cwd=repo_path)
         readme_path = os.path.join(repo_path, "README.md")
         with open(readme_path, "w") as f:
             f.write("hello world")
-        os.system(f"git -C {repo_path} add README.md")
-        os.system(f"git -C {repo_path} commit -m 'Initial commit'")
+        run_git("add", "README.md", cwd=repo_path)
+        run_git("commit", "-m", "Initial commit", cwd=repo_path)
         yield temp_dir
 
 